@@ -3,8 +3,17 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q
+from django.db.models.functions import Now
+from django.utils.functional import cached_property
 
 from .models import (
+    CACHE_TIMEOUT,
+    SETTINGS_EXISTS_CACHE_KEY,
     CraftingIngredient,
     CraftingRecipe,
     CraftingSession,
@@ -16,6 +25,33 @@ if TYPE_CHECKING:
     from django.db.models import QuerySet
 
 
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses the planner's row estimate for unfiltered changelists.
+
+    Large tables fall back to Postgres' reltuples instead of a full COUNT(*);
+    filtered querysets and small tables keep the exact count.
+    """
+
+    estimate_threshold = 10_000
+
+    @cached_property
+    def count(self) -> int:
+        query = getattr(self.object_list, "query", None)
+        if query is not None and not query.where:
+            connection = connections[self.object_list.db]
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT reltuples FROM pg_class WHERE relname = %s",
+                        [self.object_list.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                if row and row[0] >= self.estimate_threshold:
+                    return int(row[0])
+        return super().count
+
+
 @admin.register(CraftingSettings)
 class CraftingSettingsAdmin(admin.ModelAdmin):
     """Singleton-style admin for crafting settings."""
@@ -34,8 +70,14 @@ class CraftingSettingsAdmin(admin.ModelAdmin):
     )
 
     def has_add_permission(self, request):
-        # Only allow a single settings row
+        # Only allow a single settings row; the check runs on every admin
+        # page render, so cache it (invalidated by the model signals). Only a
+        # positive result is cached: the bot may create the row from its own
+        # process, and a stale "missing" would offer Add and create pk=2.
+        if cache.get(SETTINGS_EXISTS_CACHE_KEY):
+            return False
         if CraftingSettings.objects.exists():
+            cache.set(SETTINGS_EXISTS_CACHE_KEY, True, CACHE_TIMEOUT)
             return False
         return super().has_add_permission(request)
 
@@ -44,16 +86,41 @@ class CraftingIngredientInline(admin.TabularInline):
     """Inline ingredient editor for recipes."""
 
     model = CraftingIngredient
-    extra = 1
+    extra = 0
     fields = ("ball", "quantity")
     autocomplete_fields = ("ball",)
 
+    def get_extra(self, request, obj=None, **kwargs):
+        # Only new recipes get a starter row; existing ones use "Add another"
+        return 1 if obj is None else 0
+
+
+class CraftingRecipeChangeList(ChangeList):
+    """Changelist that only loads the columns shown in list_display, plus the ingredient count."""
+
+    def get_queryset(self, request, *args, **kwargs):
+        # The ingredient count is annotated on the root queryset so ChangeList
+        # can order by it; the change form and autocomplete never pay the GROUP BY
+        root_queryset = self.root_queryset
+        self.root_queryset = root_queryset.annotate(_ingredient_count=Count("ingredients"))
+        try:
+            qs = super().get_queryset(request, *args, **kwargs)
+        finally:
+            self.root_queryset = root_queryset
+        return qs.only(
+            "id",
+            "name",
+            "enabled",
+            "updated_at",
+            "result_label",
+        )
+
 
 @admin.register(CraftingRecipe)
 class CraftingRecipeAdmin(admin.ModelAdmin):
     """Admin configuration for crafting recipes."""
 
-    list_display = ("name", "enabled", "result_summary", "updated_at")
+    list_display = ("name", "enabled", "result_label", "ingredient_count", "updated_at")
     list_filter = ("enabled",)
     search_fields = ("name", "description")
     inlines = (CraftingIngredientInline,)
@@ -81,13 +148,12 @@ class CraftingRecipeAdmin(admin.ModelAdmin):
         ),
     )
 
-    @admin.display(description="Result")
-    def result_summary(self, obj: CraftingRecipe) -> str:
-        """Human readable result description."""
-        if obj.result_ball:
-            special = f" ({obj.result_special.name})" if obj.result_special else ""
-            return f"{obj.result_quantity} × {obj.result_ball.country}{special}"
-        return "No result configured"
+    def get_changelist(self, request, **kwargs):
+        return CraftingRecipeChangeList
+
+    @admin.display(description="Ingredients", ordering="_ingredient_count")
+    def ingredient_count(self, obj: CraftingRecipe) -> int:
+        return obj._ingredient_count
 
 
 class CraftingSessionItemInline(admin.TabularInline):
@@ -99,17 +165,30 @@ class CraftingSessionItemInline(admin.TabularInline):
     autocomplete_fields = ("ball_instance",)
     readonly_fields = ("ball_instance",)
 
+    def get_queryset(self, request) -> QuerySet[CraftingSessionItem]:
+        return super().get_queryset(request).select_related("ball_instance__ball")
+
 
 @admin.register(CraftingSession)
 class CraftingSessionAdmin(admin.ModelAdmin):
     """Admin for crafting sessions."""
 
     list_display = ("player", "created_at", "expires_at", "is_expired_display")
+    list_select_related = ("player",)
     search_fields = ("player__discord_id",)
     autocomplete_fields = ("player",)
     inlines = (CraftingSessionItemInline,)
     readonly_fields = ("created_at", "expires_at")
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+
+    def get_queryset(self, request) -> QuerySet[CraftingSession]:
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(_is_expired=ExpressionWrapper(Q(expires_at__lt=Now()), output_field=BooleanField()))
+        )
 
-    @admin.display(description="Expired")
+    @admin.display(description="Expired", ordering="_is_expired")
     def is_expired_display(self, obj: CraftingSession) -> str:
-        return "Yes" if obj.is_expired() else "No"
+        return "Yes" if obj._is_expired else "No"
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crafting", "0002_session_based_rewrite"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="craftingsession",
+            index=models.Index(fields=["expires_at"], name="craftsess_expires_idx"),
+        ),
+    ]
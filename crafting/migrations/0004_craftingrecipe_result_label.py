@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+def populate_result_labels(apps, schema_editor):
+    CraftingRecipe = apps.get_model("crafting", "CraftingRecipe")
+    recipes = list(CraftingRecipe.objects.select_related("result_ball", "result_special"))
+    for recipe in recipes:
+        if recipe.result_ball is None:
+            recipe.result_label = "No result configured"
+        else:
+            special = f" ({recipe.result_special.name})" if recipe.result_special else ""
+            recipe.result_label = f"{recipe.result_quantity} × {recipe.result_ball.country}{special}"
+    CraftingRecipe.objects.bulk_update(recipes, ("result_label",))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crafting", "0003_craftingsession_expires_at_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="craftingrecipe",
+            name="result_label",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Denormalized result description, kept in sync on save.",
+                max_length=256,
+                verbose_name="result",
+            ),
+        ),
+        migrations.RunPython(populate_result_labels, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crafting", "0004_craftingrecipe_result_label"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="craftingrecipe",
+            index=models.Index(
+                condition=models.Q(("enabled", True)), fields=["name"], name="recipe_enabled_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+def populate_result_names(apps, schema_editor):
+    CraftingRecipe = apps.get_model("crafting", "CraftingRecipe")
+    recipes = list(CraftingRecipe.objects.select_related("result_ball", "result_special"))
+    for recipe in recipes:
+        recipe.result_ball_name = recipe.result_ball.country if recipe.result_ball else ""
+        recipe.result_special_name = recipe.result_special.name if recipe.result_special else ""
+    CraftingRecipe.objects.bulk_update(recipes, ("result_ball_name", "result_special_name"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crafting", "0005_craftingrecipe_enabled_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="craftingrecipe",
+            name="result_ball_name",
+            field=models.CharField(
+                blank=True, editable=False, help_text="Denormalized country of the result ball.", max_length=128
+            ),
+        ),
+        migrations.AddField(
+            model_name="craftingrecipe",
+            name="result_special_name",
+            field=models.CharField(
+                blank=True, editable=False, help_text="Denormalized name of the result special.", max_length=128
+            ),
+        ),
+        migrations.RunPython(populate_result_names, migrations.RunPython.noop),
+    ]
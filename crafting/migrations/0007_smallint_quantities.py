@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("crafting", "0006_craftingrecipe_result_names"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="craftingingredient",
+            name="quantity",
+            field=models.PositiveSmallIntegerField(default=1, help_text="How many of this ball are needed."),
+        ),
+        migrations.AlterField(
+            model_name="craftingrecipe",
+            name="result_quantity",
+            field=models.PositiveSmallIntegerField(default=1, help_text="Quantity of balls to grant."),
+        ),
+    ]
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
+import time
+
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
 from django.utils import timezone
 
 from bd_models.models import Ball, BallInstance, Player, Special
 
+SETTINGS_EXISTS_CACHE_KEY = "crafting:settings_exists"
+SETTINGS_CACHE_KEY = "crafting:settings"
+# Shared-cache lifetime, and the lifetime of the in-process copies. The bot
+# and the admin panel run in separate processes, so in-process copies also
+# expire on their own rather than relying on signals alone.
+CACHE_TIMEOUT = 60
+LOCAL_CACHE_TTL = 30
+NO_RESULT_LABEL = "No result configured"
+RESULT_DISPLAY_FIELDS = ("result_ball_name", "result_special_name", "result_label")
+
 
 class CraftingSettings(models.Model):
     """Singleton configuration for crafting behaviour."""
@@ -25,11 +40,31 @@ class CraftingSettings(models.Model):
         """
         Lightweight replacement for django-solo's get_solo().
 
-        Ensures there is always exactly one settings row.
+        Ensures there is always exactly one settings row. The row is cached
+        in-process for ``LOCAL_CACHE_TTL`` seconds and in Django's cache
+        for ``CACHE_TIMEOUT`` seconds; saving it clears both.
         """
-        obj, _ = cls.objects.get_or_create(pk=1)
+        global _settings_cache
+        obj = cls.get_local()
+        if obj is not None:
+            return obj
+        obj = cache.get(SETTINGS_CACHE_KEY)
+        if obj is None:
+            obj, _ = cls.objects.get_or_create(pk=1)
+            cache.set(SETTINGS_CACHE_KEY, obj, CACHE_TIMEOUT)
+        _settings_cache = (time.monotonic(), obj)
         return obj
 
+    @staticmethod
+    def get_local() -> "CraftingSettings | None":
+        """The in-process cached settings row, if still fresh. Never touches I/O."""
+        if _settings_cache is not None and time.monotonic() - _settings_cache[0] < LOCAL_CACHE_TTL:
+            return _settings_cache[1]
+        return None
+
+
+_settings_cache: tuple[float, CraftingSettings] | None = None
+
 
 class CraftingRecipe(models.Model):
     """Simple crafting recipe - combine balls to get a new ball."""
@@ -46,7 +81,7 @@ class CraftingRecipe(models.Model):
         blank=True,
         help_text="Ball awarded when recipe is crafted.",
     )
-    result_quantity = models.PositiveIntegerField(default=1, help_text="Quantity of balls to grant.")
+    result_quantity = models.PositiveSmallIntegerField(default=1, help_text="Quantity of balls to grant.")
     result_special = models.ForeignKey(
         Special,
         on_delete=models.SET_NULL,
@@ -54,6 +89,19 @@ class CraftingRecipe(models.Model):
         blank=True,
         help_text="Optional special applied to crafted BallInstances.",
     )
+    result_ball_name = models.CharField(
+        max_length=128, blank=True, editable=False, help_text="Denormalized country of the result ball."
+    )
+    result_special_name = models.CharField(
+        max_length=128, blank=True, editable=False, help_text="Denormalized name of the result special."
+    )
+    result_label = models.CharField(
+        "result",
+        max_length=256,
+        blank=True,
+        editable=False,
+        help_text="Denormalized result description, kept in sync on save.",
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -62,10 +110,119 @@ class CraftingRecipe(models.Model):
         verbose_name = "Crafting Recipe"
         verbose_name_plural = "Crafting Recipes"
         ordering = ("name",)
+        indexes = (models.Index(fields=("name",), condition=models.Q(enabled=True), name="recipe_enabled_idx"),)
 
     def __str__(self) -> str:
         return self.name
 
+    @classmethod
+    def for_cards(cls) -> models.QuerySet["CraftingRecipe"]:
+        """
+        Enabled recipes loaded with only the columns recipe cards display.
+
+        Ingredients (with their ball country) are prefetched into
+        ``display_ingredients``.
+        """
+        return (
+            cls.objects.filter(enabled=True)
+            .only("id", "name", "description", "result_quantity", "result_ball_name", "result_special_name")
+            .prefetch_related(
+                models.Prefetch(
+                    "ingredients",
+                    queryset=CraftingIngredient.objects.only("id", "recipe", "quantity", "ball__country"),
+                    to_attr="display_ingredients",
+                )
+            )
+        )
+
+    def get_ingredients_cached(self) -> tuple[tuple[int, int], ...]:
+        """
+        Return this recipe's ``(ball_id, quantity)`` requirements.
+
+        Cached in-process and in Django's cache like the settings row, and
+        dropped whenever one of the recipe's ingredients is saved or deleted.
+        """
+        ingredients = _local_recipe_ingredients(self.pk)
+        if ingredients is not None:
+            return ingredients
+        key = recipe_ingredients_cache_key(self.pk)
+        ingredients = cache.get(key)
+        if ingredients is None:
+            ingredients = tuple(self.ingredients.values_list("ball_id", "quantity"))
+            cache.set(key, ingredients, CACHE_TIMEOUT)
+        _recipe_ingredients_cache[self.pk] = (time.monotonic(), ingredients)
+        return ingredients
+
+    @classmethod
+    def prime_ingredients_cache(cls, recipes: list["CraftingRecipe"]) -> None:
+        """
+        Warm the ingredient cache for many recipes at once.
+
+        Uses one ``get_many`` and at most one ingredient query for every
+        recipe missing from the in-process cache, instead of a lookup per
+        recipe in ``get_ingredients_cached``.
+        """
+        missing = [recipe.pk for recipe in recipes if _local_recipe_ingredients(recipe.pk) is None]
+        if not missing:
+            return
+        keys = {recipe_ingredients_cache_key(pk): pk for pk in missing}
+        found = {keys[key]: value for key, value in cache.get_many(keys).items()}
+        to_query = [pk for pk in missing if pk not in found]
+        if to_query:
+            grouped: dict[int, list[tuple[int, int]]] = {pk: [] for pk in to_query}
+            rows = CraftingIngredient.objects.filter(recipe_id__in=to_query).values_list(
+                "recipe_id", "ball_id", "quantity"
+            )
+            for recipe_id, ball_id, quantity in rows:
+                grouped[recipe_id].append((ball_id, quantity))
+            queried = {pk: tuple(pairs) for pk, pairs in grouped.items()}
+            cache.set_many({recipe_ingredients_cache_key(pk): value for pk, value in queried.items()}, CACHE_TIMEOUT)
+            found.update(queried)
+        now = time.monotonic()
+        for pk, ingredients in found.items():
+            _recipe_ingredients_cache[pk] = (now, ingredients)
+
+    def build_result_label(self) -> str:
+        """Human readable result description, e.g. ``2 × France (Shiny)``."""
+        if not self.result_ball_name:
+            return NO_RESULT_LABEL
+        special = f" ({self.result_special_name})" if self.result_special_name else ""
+        return f"{self.result_quantity} × {self.result_ball_name}{special}"
+
+    def refresh_result_display(self) -> None:
+        """Copy the result ball/special names onto the row for join-free listings."""
+        self.result_ball_name = self.result_ball.country if self.result_ball_id else ""
+        self.result_special_name = self.result_special.name if self.result_special_id else ""
+        self.result_label = self.build_result_label()
+
+    def save(self, *args, **kwargs) -> None:
+        self.refresh_result_display()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *RESULT_DISPLAY_FIELDS}
+        super().save(*args, **kwargs)
+
+
+_recipe_ingredients_cache: dict[int, tuple[float, tuple[tuple[int, int], ...]]] = {}
+
+
+def recipe_ingredients_cache_key(recipe_id: int) -> str:
+    return f"crafting:recipe:{recipe_id}:ingredients"
+
+
+def _local_recipe_ingredients(recipe_id: int) -> tuple[tuple[int, int], ...] | None:
+    entry = _recipe_ingredients_cache.get(recipe_id)
+    if entry is not None and time.monotonic() - entry[0] < LOCAL_CACHE_TTL:
+        return entry[1]
+    return None
+
+
+class IngredientManager(models.Manager):
+    """Ingredients are always displayed with their ball, so join it by default."""
+
+    def get_queryset(self) -> models.QuerySet["CraftingIngredient"]:
+        return super().get_queryset().select_related("ball")
+
 
 class CraftingIngredient(models.Model):
     """Ball ingredient required for a recipe."""
@@ -79,7 +236,9 @@ class CraftingIngredient(models.Model):
         help_text="Ball required for this recipe.",
         related_name="crafting_ingredients",
     )
-    quantity = models.PositiveIntegerField(default=1, help_text="How many of this ball are needed.")
+    quantity = models.PositiveSmallIntegerField(default=1, help_text="How many of this ball are needed.")
+
+    objects = IngredientManager()
 
     class Meta:
         verbose_name = "Crafting Ingredient"
@@ -99,6 +258,7 @@ class CraftingSession(models.Model):
     class Meta:
         verbose_name = "Crafting Session"
         verbose_name_plural = "Crafting Sessions"
+        indexes = (models.Index(fields=("expires_at",), name="craftsess_expires_idx"),)
 
     def __str__(self) -> str:
         return f"Session for {self.player_id}"
@@ -120,3 +280,51 @@ class CraftingSessionItem(models.Model):
 
     def __str__(self) -> str:
         return f"{self.ball_instance} in session {self.session_id}"
+
+
+@receiver((post_save, post_delete), sender=CraftingSettings)
+def _invalidate_settings_cache(sender, **kwargs) -> None:
+    """Drop cached singleton state whenever the settings row changes."""
+    global _settings_cache
+    _settings_cache = None
+    cache.delete_many((SETTINGS_EXISTS_CACHE_KEY, SETTINGS_CACHE_KEY))
+
+
+@receiver((post_save, post_delete), sender=CraftingIngredient)
+def _invalidate_recipe_ingredients_cache(sender, instance: CraftingIngredient, **kwargs) -> None:
+    """Drop the cached requirements of the recipe an ingredient belongs to."""
+    _recipe_ingredients_cache.pop(instance.recipe_id, None)
+    cache.delete(recipe_ingredients_cache_key(instance.recipe_id))
+
+
+def _refresh_result_display(recipes, **names: str) -> None:
+    recipes = list(recipes)
+    for recipe in recipes:
+        for field, value in names.items():
+            setattr(recipe, field, value)
+        recipe.result_label = recipe.build_result_label()
+    CraftingRecipe.objects.bulk_update(recipes, RESULT_DISPLAY_FIELDS)
+
+
+@receiver(post_save, sender=Ball)
+def _ball_saved(sender, instance: Ball, **kwargs) -> None:
+    """Keep denormalized result names in sync when a result ball is renamed."""
+    _refresh_result_display(CraftingRecipe.objects.filter(result_ball=instance), result_ball_name=instance.country)
+
+
+@receiver(post_save, sender=Special)
+def _special_saved(sender, instance: Special, **kwargs) -> None:
+    """Keep denormalized result names in sync when a result special is renamed."""
+    _refresh_result_display(CraftingRecipe.objects.filter(result_special=instance), result_special_name=instance.name)
+
+
+@receiver(pre_delete, sender=Ball)
+def _ball_deleted(sender, instance: Ball, **kwargs) -> None:
+    """Clear result names up front; SET_NULL is a bulk UPDATE that bypasses save()."""
+    _refresh_result_display(CraftingRecipe.objects.filter(result_ball=instance), result_ball_name="")
+
+
+@receiver(pre_delete, sender=Special)
+def _special_deleted(sender, instance: Special, **kwargs) -> None:
+    """Clear result names up front; SET_NULL is a bulk UPDATE that bypasses save()."""
+    _refresh_result_display(CraftingRecipe.objects.filter(result_special=instance), result_special_name="")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+from collections import Counter, defaultdict
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
@@ -7,11 +9,15 @@ import discord
 from asgiref.sync import sync_to_async
 from discord import app_commands
 from discord.ext import commands
-from django.db import transaction
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 
 from bd_models.models import BallInstance, Player
 from ..models import (
+    LOCAL_CACHE_TTL,
     CraftingIngredient,
     CraftingRecipe,
     CraftingSession,
@@ -24,10 +30,96 @@ if TYPE_CHECKING:
 
 Interaction = discord.Interaction["BallsDexBot"]
 
+# Card art and long text on Ball/Special that instance listings never read.
+# Deferred rather than listing the needed fields with only(): short_description()
+# reads BallInstance columns we do not control, and a deferred column loaded
+# lazily from async code raises SynchronousOnlyOperation.
+LISTING_DEFERRED_FIELDS = (
+    "ball__wild_card",
+    "ball__collection_card",
+    "ball__credits",
+    "ball__capacity_description",
+    "special__background",
+    "special__catch_phrase",
+)
+
+
+class IngredientsUnavailable(Exception):
+    """Raised inside the craft transaction to roll it back when session balls are gone."""
+
 
 async def get_settings() -> CraftingSettings:
     """Load crafting settings in async context."""
-    return await sync_to_async(CraftingSettings.get_solo)()
+    # Fresh in-process copies are returned without a thread hop
+    settings = CraftingSettings.get_local()
+    if settings is None:
+        settings = await sync_to_async(CraftingSettings.get_solo)()
+    return settings
+
+
+class RecipeIndex:
+    """
+    Enabled recipes indexed by the balls they require.
+
+    Craftability lookups only visit recipes that share a ball with the
+    session, instead of walking every ingredient of every recipe.
+    """
+
+    def __init__(self, recipes: list[CraftingRecipe]):
+        self.recipes = recipes
+        self.by_id = {recipe.pk: recipe for recipe in recipes}
+        self.requirements: dict[int, dict[int, int]] = {}
+        self.by_ball: dict[int, list[tuple[int, int]]] = defaultdict(list)
+        for recipe in recipes:
+            requirements: dict[int, int] = defaultdict(int)
+            for ball_id, quantity in recipe.get_ingredients_cached():
+                requirements[ball_id] += quantity
+            self.requirements[recipe.pk] = dict(requirements)
+            for ball_id, quantity in requirements.items():
+                self.by_ball[ball_id].append((recipe.pk, quantity))
+
+    @classmethod
+    def build(cls) -> "RecipeIndex":
+        """Load enabled recipes and their requirements (sync context)."""
+        recipes = list(CraftingRecipe.objects.filter(enabled=True).select_related("result_ball", "result_special"))
+        CraftingRecipe.prime_ingredients_cache(recipes)
+        return cls(recipes)
+
+    def craftable(self, ball_counts: Counter[int]) -> list[CraftingRecipe]:
+        """Recipes, in name order, whose requirements ``ball_counts`` covers."""
+        satisfied: Counter[int] = Counter()
+        for ball_id, count in ball_counts.items():
+            for recipe_id, quantity in self.by_ball.get(ball_id, ()):
+                if count >= quantity:
+                    satisfied[recipe_id] += 1
+        return [recipe for recipe in self.recipes if satisfied[recipe.pk] == len(self.requirements[recipe.pk])]
+
+    def can_craft(self, recipe_id: int, ball_counts: Counter[int]) -> bool:
+        """Whether ``ball_counts`` covers one specific enabled recipe."""
+        requirements = self.requirements.get(recipe_id)
+        if requirements is None:
+            return False
+        return all(ball_counts[ball_id] >= quantity for ball_id, quantity in requirements.items())
+
+
+_recipe_index: tuple[float, RecipeIndex] | None = None
+
+
+async def get_recipe_index() -> RecipeIndex:
+    """Return the recipe index, rebuilding it once it is older than the cache TTL."""
+    global _recipe_index
+    if _recipe_index is not None and time.monotonic() - _recipe_index[0] < LOCAL_CACHE_TTL:
+        return _recipe_index[1]
+    index = await sync_to_async(RecipeIndex.build)()
+    _recipe_index = (time.monotonic(), index)
+    return index
+
+
+@receiver((post_save, post_delete), sender=CraftingRecipe)
+@receiver((post_save, post_delete), sender=CraftingIngredient)
+def _invalidate_recipe_index(sender, **kwargs) -> None:
+    global _recipe_index
+    _recipe_index = None
 
 
 async def ensure_player(user: discord.abc.User) -> Player:
@@ -36,21 +128,37 @@ async def ensure_player(user: discord.abc.User) -> Player:
     return player
 
 
+def _get_or_create_session_sync(player: Player, settings: CraftingSettings) -> CraftingSession:
+    now = timezone.now()
+    expires_at = now + timedelta(minutes=settings.session_timeout_minutes)
+    with transaction.atomic():
+        # The row lock serialises concurrent adds for the same player
+        session, created = CraftingSession.objects.select_for_update().get_or_create(
+            player=player, defaults={"expires_at": expires_at}
+        )
+        if not created and session.is_expired():
+            # Reuse the expired row as a fresh session
+            CraftingSessionItem.objects.filter(session=session).delete()
+            session.created_at = now
+            session.expires_at = expires_at
+            session.save(update_fields=("created_at", "expires_at"))
+    return session
+
+
 async def get_or_create_session(player: Player, settings: CraftingSettings) -> CraftingSession:
     """Get or create a crafting session for a player."""
-    try:
-        session = await CraftingSession.objects.select_related("player").prefetch_related(
-            "items__ball_instance__ball"
-        ).aget(player=player)
-        if session.is_expired():
-            # Delete expired session and create new one
-            await session.adelete()
-            raise CraftingSession.DoesNotExist
-        return session
-    except CraftingSession.DoesNotExist:
-        expires_at = timezone.now() + timedelta(minutes=settings.session_timeout_minutes)
-        session = await CraftingSession.objects.acreate(player=player, expires_at=expires_at)
-        return session
+    return await sync_to_async(_get_or_create_session_sync)(player, settings)
+
+
+def format_session_instance(instance: BallInstance) -> str:
+    """One line of the session embed's ingredient list."""
+    special_emoji = ""
+    if instance.special_id and instance.special.emoji:
+        special_emoji = f"{instance.special.emoji} "
+    return (
+        f"{special_emoji}{instance.short_description()} "
+        f"(ATK: {instance.attack_bonus:+d}%, HP: {instance.health_bonus:+d}%)"
+    )
 
 
 class CraftView(discord.ui.View):
@@ -61,11 +169,14 @@ class CraftView(discord.ui.View):
         self.cog = cog
         self.player = player
         self.session = session
+        # Recipes shown as craftable when the embed was built
+        self.craftable_recipe_ids: list[int] = []
 
     @discord.ui.button(label="Craft", style=discord.ButtonStyle.green, emoji="🔨")
     async def craft_button(self, interaction: Interaction, button: discord.ui.Button):
-        await interaction.response.defer(thinking=True)
-        result = await self.cog._perform_craft_from_session(self.player, self.session)
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        recipe_id = self.craftable_recipe_ids[0] if self.craftable_recipe_ids else None
+        result = await self.cog._perform_craft_from_session(self.player, self.session, recipe_id)
         if result["success"]:
             embed = discord.Embed(
                 title="✅ Craft Successful!",
@@ -85,8 +196,9 @@ class CraftView(discord.ui.View):
 
     @discord.ui.button(label="Cancel", style=discord.ButtonStyle.red, emoji="❌")
     async def cancel_button(self, interaction: Interaction, button: discord.ui.Button):
+        await interaction.response.defer(ephemeral=True, thinking=True)
         await self.session.adelete()
-        await interaction.response.send_message("Crafting session cancelled.", ephemeral=True)
+        await interaction.followup.send("Crafting session cancelled.", ephemeral=True)
 
 
 class CraftingCog(commands.GroupCog, name="craft"):
@@ -99,75 +211,63 @@ class CraftingCog(commands.GroupCog, name="craft"):
     async def _send_session_embed(
         self, interaction: Interaction | None, player: Player, session: CraftingSession
     ) -> discord.Embed:
-        """Create and send the crafting session embed."""
-        settings = await get_settings()
-        items = await sync_to_async(list)(
-            session.items.select_related("ball_instance__ball", "ball_instance__special").all()
-        )
+        """
+        Create and send the crafting session embed.
+
+        ``interaction`` must already be deferred; the embed is sent as a followup.
+        """
+        def load_session():
+            # Count balls by type and sum their stats in SQL
+            totals = list(
+                session.items.values("ball_instance__ball_id").annotate(
+                    count=Count("id"),
+                    atk=Sum(
+                        F("ball_instance__ball__attack")
+                        + F("ball_instance__ball__attack") * F("ball_instance__attack_bonus") / 100
+                    ),
+                    hp=Sum(
+                        F("ball_instance__ball__health")
+                        + F("ball_instance__ball__health") * F("ball_instance__health_bonus") / 100
+                    ),
+                )
+            )
+            # Only the displayed instances are loaded
+            display_items = list(
+                session.items.select_related("ball_instance__ball", "ball_instance__special")
+                .defer(*(f"ball_instance__{field}" for field in LISTING_DEFERRED_FIELDS))
+                .order_by("id")[:20]
+            )
+            return totals, display_items
 
-        # Count balls by type
-        ball_counts: dict[str, int] = {}
-        total_atk = 0
-        total_hp = 0
-        current_ingredients = []
+        totals, display_items = await sync_to_async(load_session)()
+        ball_counts: Counter[int] = Counter({row["ball_instance__ball_id"]: row["count"] for row in totals})
+        item_count = sum(ball_counts.values())
+        total_atk = sum(row["atk"] for row in totals)
+        total_hp = sum(row["hp"] for row in totals)
 
-        for item in items:
-            ball = item.ball_instance.ball
-            ball_name = ball.country
-            ball_counts[ball_name] = ball_counts.get(ball_name, 0) + 1
-
-            # Calculate stats
-            atk_bonus = item.ball_instance.attack_bonus
-            hp_bonus = item.ball_instance.health_bonus
-            atk = ball.attack + int(ball.attack * atk_bonus * 0.01)
-            hp = ball.health + int(ball.health * hp_bonus * 0.01)
-            total_atk += atk
-            total_hp += hp
-
-            # Format instance display
-            special_emoji = ""
-            if item.ball_instance.special:
-                special_emoji = f"{item.ball_instance.special.emoji} " if hasattr(item.ball_instance.special, 'emoji') else ""
-            instance_str = f"{special_emoji}{item.ball_instance.short_description()} (ATK: {atk_bonus:+d}%, HP: {hp_bonus:+d}%)"
-            current_ingredients.append(instance_str)
+        current_ingredients = [format_session_instance(item.ball_instance) for item in display_items]
 
         # Find recipes that can be crafted
-        all_recipes = await sync_to_async(list)(
-            CraftingRecipe.objects.filter(enabled=True)
-            .select_related("result_ball", "result_special")
-            .prefetch_related("ingredients__ball")
-        )
-
-        craftable_recipes = []
-        for recipe in all_recipes:
-            ingredients = await sync_to_async(list)(recipe.ingredients.select_related("ball").all())
-            can_craft = True
-            for ingredient in ingredients:
-                count = ball_counts.get(ingredient.ball.country, 0)
-                if count < ingredient.quantity:
-                    can_craft = False
-                    break
-            if can_craft:
-                craftable_recipes.append(recipe)
+        craftable = (await get_recipe_index()).craftable(ball_counts)
 
         # Build embed
         embed = discord.Embed(
-            title="🔨 Can Craft" if craftable_recipes else "❌ Cannot Craft",
+            title="🔨 Can Craft" if craftable else "❌ Cannot Craft",
             description="Add ingredients to see possible recipes. Use `/craft recipes` to view all available recipes.",
-            color=discord.Color.green() if craftable_recipes else discord.Color.red(),
+            color=discord.Color.green() if craftable else discord.Color.red(),
         )
 
         # Current ingredients
         if current_ingredients:
-            ingredients_text = "\n".join(current_ingredients[:20])  # Limit to 20 for display
-            if len(current_ingredients) > 20:
-                ingredients_text += f"\n*(+{len(current_ingredients) - 20} more)*"
+            ingredients_text = "\n".join(current_ingredients)
+            if item_count > len(current_ingredients):
+                ingredients_text += f"\n*(+{item_count - len(current_ingredients)} more)*"
             embed.add_field(name="Current Ingredients", value=ingredients_text, inline=False)
         else:
             embed.add_field(name="Current Ingredients", value="None", inline=False)
 
         # Total stats
-        if items:
+        if item_count:
             embed.add_field(
                 name="Total Stats of all ingredients",
                 value=f"ATK: {total_atk} | HP: {total_hp}",
@@ -175,10 +275,10 @@ class CraftingCog(commands.GroupCog, name="craft"):
             )
 
         # Craftable recipes
-        if craftable_recipes:
-            recipe_names = [r.name for r in craftable_recipes[:10]]
+        if craftable:
+            recipe_names = [r.name for r in craftable[:10]]
             embed.add_field(
-                name=f"Can Craft ({len(craftable_recipes)})",
+                name=f"Can Craft ({len(craftable)})",
                 value=", ".join(recipe_names) or "None",
                 inline=False,
             )
@@ -195,103 +295,124 @@ class CraftingCog(commands.GroupCog, name="craft"):
             inline=False,
         )
 
-        view = CraftView(self, player, session) if craftable_recipes else None
+        view = None
+        if craftable:
+            view = CraftView(self, player, session)
+            view.craftable_recipe_ids = [r.pk for r in craftable]
 
         if interaction:
-            if interaction.response.is_done():
-                await interaction.followup.send(embed=embed, view=view, ephemeral=True)
-            else:
-                await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
-        else:
-            return embed
+            await interaction.followup.send(embed=embed, view=view, ephemeral=True)
 
         return embed
 
-    async def _perform_craft_from_session(self, player: Player, session: CraftingSession) -> dict:
-        """Perform craft using session ingredients."""
+    async def _perform_craft_from_session(
+        self, player: Player, session: CraftingSession, recipe_id: int | None = None
+    ) -> dict:
+        """
+        Perform craft using session ingredients.
+
+        ``recipe_id`` crafts the recipe the session embed offered; without it
+        the first craftable recipe is used.
+        """
         settings = await get_settings()
         if not settings.enabled:
             return {"success": False, "message": "Crafting is currently disabled."}
 
-        items = await sync_to_async(list)(
-            session.items.select_related("ball_instance__ball").all()
-        )
-
-        # Count balls by type
-        ball_counts: dict[str, int] = {}
-        ball_instances: dict[str, list[BallInstance]] = {}
-        for item in items:
-            ball_name = item.ball_instance.ball.country
-            ball_counts[ball_name] = ball_counts.get(ball_name, 0) + 1
-            if ball_name not in ball_instances:
-                ball_instances[ball_name] = []
-            ball_instances[ball_name].append(item.ball_instance)
-
-        # Find first craftable recipe
-        all_recipes = await sync_to_async(list)(
-            CraftingRecipe.objects.filter(enabled=True)
-            .select_related("result_ball", "result_special")
-            .prefetch_related("ingredients__ball")
-        )
-
-        recipe = None
-        for r in all_recipes:
-            ingredients = await sync_to_async(list)(r.ingredients.select_related("ball").all())
-            can_craft = True
-            for ingredient in ingredients:
-                count = ball_counts.get(ingredient.ball.country, 0)
-                if count < ingredient.quantity:
-                    can_craft = False
-                    break
-            if can_craft:
-                recipe = r
-                break
-
-        if not recipe:
-            return {"success": False, "message": "No recipe can be crafted with current ingredients."}
+        index = await get_recipe_index()
 
-        if not recipe.result_ball:
-            return {"success": False, "message": "Recipe has no result configured."}
-
-        # Get ingredients in sync context first
-        ingredients = await sync_to_async(list)(recipe.ingredients.select_related("ball").all())
-
-        # Consume ingredients and create result
-        def perform_craft(ingredients_list):
+        # Load ingredients, pick the recipe, consume and create in one transaction
+        def perform_craft():
             with transaction.atomic():
-                # Delete consumed ball instances
-                consumed_count = 0
-                for ingredient in ingredients_list:
-                    needed = ingredient.quantity
-                    available = ball_instances.get(ingredient.ball.country, [])
-                    for _ in range(min(needed, len(available))):
-                        instance = available.pop(0)
-                        instance.deleted = True
-                        instance.save(update_fields=("deleted",))
-                        consumed_count += 1
-
-                # Create result
-                created_ids = []
-                for _ in range(recipe.result_quantity):
-                    new_instance = BallInstance.objects.create(
-                        ball=recipe.result_ball,
-            player=player,
-            special=recipe.result_special,
-            attack_bonus=0,
-            health_bonus=0,
-            spawned_time=timezone.now(),
-            catch_date=timezone.now(),
-        )
-                    created_ids.append(new_instance.pk)
+                # Lock the session so concurrent crafts for it run one at a time
+                if CraftingSession.objects.select_for_update().filter(pk=session.pk).first() is None:
+                    return None, "Your crafting session has ended.", []
+
+                items = list(session.items.select_related("ball_instance__ball").all())
+
+                # Count balls by type
+                ball_counts: Counter[int] = Counter()
+                ball_instances: dict[int, list[BallInstance]] = defaultdict(list)
+                for item in items:
+                    ball_id = item.ball_instance.ball_id
+                    ball_counts[ball_id] += 1
+                    ball_instances[ball_id].append(item.ball_instance)
+
+                if recipe_id is not None:
+                    recipe = index.by_id[recipe_id] if index.can_craft(recipe_id, ball_counts) else None
+                else:
+                    # Find first craftable recipe
+                    craftable = index.craftable(ball_counts)
+                    recipe = craftable[0] if craftable else None
+
+                if not recipe:
+                    return None, "No recipe can be crafted with current ingredients.", []
+
+                # The index can lag admin edits made in another process; re-read the
+                # chosen recipe and its requirements before consuming anything
+                recipe = (
+                    CraftingRecipe.objects.select_related("result_ball", "result_special")
+                    .filter(pk=recipe.pk, enabled=True)
+                    .first()
+                )
+                requirements: dict[int, int] = defaultdict(int)
+                if recipe is not None:
+                    for ball_id, quantity in CraftingIngredient.objects.filter(recipe=recipe).values_list(
+                        "ball_id", "quantity"
+                    ):
+                        requirements[ball_id] += quantity
+                if recipe is None or any(ball_counts[ball_id] < quantity for ball_id, quantity in requirements.items()):
+                    return None, "That recipe has changed or is no longer available. Check your session again.", []
+
+                if not recipe.result_ball:
+                    return None, "Recipe has no result configured.", []
+
+                # Delete consumed ball instances in a single UPDATE
+                consumed_ids: list[int] = []
+                for ball_id, quantity in requirements.items():
+                    available = ball_instances.get(ball_id, [])
+                    consumed_ids.extend(instance.pk for instance in available[:quantity])
+                    del available[:quantity]
+                # Balls traded or deleted since they were added must not be consumed
+                consumed = BallInstance.objects.filter(
+                    pk__in=consumed_ids, player_id=session.player_id, deleted=False
+                ).update(deleted=True)
+                if consumed != len(consumed_ids):
+                    raise IngredientsUnavailable
+
+                # Create result in a single INSERT
+                now = timezone.now()
+                created = BallInstance.objects.bulk_create(
+                    [
+                        BallInstance(
+                            ball=recipe.result_ball,
+                            player=player,
+                            special=recipe.result_special,
+                            attack_bonus=0,
+                            health_bonus=0,
+                            spawned_time=now,
+                            catch_date=now,
+                        )
+                        for _ in range(recipe.result_quantity)
+                    ],
+                    batch_size=500,
+                )
 
                 # Delete session items that were consumed
                 CraftingSessionItem.objects.filter(session=session).delete()
 
-                return created_ids, consumed_count
+            return recipe, None, [instance.pk for instance in created]
 
-        created_ids, consumed = await sync_to_async(perform_craft)(ingredients)
-
-        ids_display = ", ".join(f"#{pk:0X}" for pk in created_ids)
+        try:
+            recipe, error, created_ids = await sync_to_async(perform_craft)()
+        except IngredientsUnavailable:
+            return {
+                "success": False,
+                "message": "Some ingredients are no longer yours. Remove them from the session and try again.",
+            }
+        if recipe is None:
+            return {"success": False, "message": error}
+
+        ids_display = ", ".join(map("#{:X}".format, created_ids))
         special_suffix = f" with {recipe.result_special.name}" if recipe.result_special else ""
         message = f"Crafted {recipe.result_quantity} × {recipe.result_ball.country}{special_suffix}\n**Pixels:** {ids_display}"
 
@@ -303,33 +424,24 @@ class CraftingCog(commands.GroupCog, name="craft"):
         self, interaction: Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete for adding instances - shows user's balls not in session."""
-        player = await ensure_player(interaction.user)
-        
-        # Get current session if exists
-        try:
-            session = await CraftingSession.objects.prefetch_related("items__ball_instance").aget(player=player)
-            session_instance_ids = await sync_to_async(list)(
-                session.items.values_list("ball_instance_id", flat=True)
-            )
-        except CraftingSession.DoesNotExist:
-            session_instance_ids = []
-
-        # Get user's ball instances not in session
+        # Runs on every keystroke: one query, with the session as a subquery
+        in_session = CraftingSessionItem.objects.filter(
+            session__player__discord_id=interaction.user.id
+        ).values("ball_instance_id")
         queryset = BallInstance.objects.filter(
-            player=player, deleted=False
-        ).exclude(id__in=session_instance_ids).select_related("ball", "special")[:25]
+            player__discord_id=interaction.user.id, deleted=False
+        ).exclude(id__in=in_session).select_related("ball", "special")
 
         if current:
             # Try to parse as hex ID
             try:
-                current_hex = current.strip().lstrip("#")
-                current_int = int(current_hex, 16)
+                current_int = int(current.strip().lstrip("#"), 16)
                 queryset = queryset.filter(id=current_int)
             except ValueError:
                 # Search by ball name
                 queryset = queryset.filter(ball__country__icontains=current)
 
-        instances = await sync_to_async(list)(queryset)
+        instances = await sync_to_async(list)(queryset[:25])
         choices = []
         for instance in instances:
             desc = instance.short_description()
@@ -343,35 +455,30 @@ class CraftingCog(commands.GroupCog, name="craft"):
         self, interaction: Interaction, current: str
     ) -> list[app_commands.Choice[str]]:
         """Autocomplete for removing instances - shows balls in current session."""
-        player = await ensure_player(interaction.user)
-        
-        # Get current session
-        try:
-            session = await CraftingSession.objects.prefetch_related(
-                "items__ball_instance__ball", "items__ball_instance__special"
-            ).aget(player=player)
-        except CraftingSession.DoesNotExist:
-            return []
-
-        # Get session items
+        # Get session items; no session simply yields no rows
         items = await sync_to_async(list)(
-            session.items.select_related("ball_instance__ball", "ball_instance__special").all()
+            CraftingSessionItem.objects.filter(session__player__discord_id=interaction.user.id)
+            .select_related("ball_instance__ball", "ball_instance__special")
+            .defer(*(f"ball_instance__{field}" for field in LISTING_DEFERRED_FIELDS))
         )
 
+        current_lower = current.lower()
+        current_upper = current.upper()
         choices = []
         for item in items:
             instance = item.ball_instance
             desc = instance.short_description()
             value = f"{instance.pk:X}"
-            
+
             # Filter by current if provided
-            if current:
-                if current.lower() not in desc.lower() and current.upper() not in value:
-                    continue
-            
+            if current and current_lower not in desc.lower() and current_upper not in value:
+                continue
+
             choices.append(app_commands.Choice(name=desc, value=value))
+            if len(choices) == 25:
+                break
 
-        return choices[:25]
+        return choices
 
     # ----- Commands -----
 
@@ -384,8 +491,7 @@ class CraftingCog(commands.GroupCog, name="craft"):
 
         # Parse instance ID (remove # if present, convert hex to int)
         try:
-            instance_id = instance_id.strip().lstrip("#")
-            instance_pk = int(instance_id, 16)
+            instance_pk = int(instance_id.strip().lstrip("#"), 16)
         except ValueError:
             await interaction.followup.send("Invalid instance ID format. Use format like #ABC123", ephemeral=True)
             return
@@ -399,8 +505,10 @@ class CraftingCog(commands.GroupCog, name="craft"):
 
         # Get ball instance
         try:
-            instance = await BallInstance.objects.select_related("ball", "special").aget(
-                pk=instance_pk, player=player, deleted=False
+            instance = (
+                await BallInstance.objects.select_related("ball", "special")
+                .defer(*LISTING_DEFERRED_FIELDS)
+                .aget(pk=instance_pk, player=player, deleted=False)
             )
         except BallInstance.DoesNotExist:
             await interaction.followup.send("Ball instance not found or you don't own it.", ephemeral=True)
@@ -409,15 +517,16 @@ class CraftingCog(commands.GroupCog, name="craft"):
         # Get or create session
         session = await get_or_create_session(player, settings)
 
-        # Check if already added
-        exists = await CraftingSessionItem.objects.filter(session=session, ball_instance=instance).aexists()
-        if exists:
+        # Add to session; the (session, ball_instance) unique index rejects duplicates
+        try:
+            await CraftingSessionItem.objects.acreate(session=session, ball_instance=instance)
+        except IntegrityError:
+            # Other violations, e.g. the session being deleted meanwhile, are real errors
+            if not await CraftingSessionItem.objects.filter(session=session, ball_instance=instance).aexists():
+                raise
             await interaction.followup.send(f"{instance.short_description()} is already in your crafting session!", ephemeral=True)
             return
 
-        # Add to session
-        await CraftingSessionItem.objects.acreate(session=session, ball_instance=instance)
-
         await interaction.followup.send(f"Added {instance.short_description()} to crafting session!", ephemeral=True)
 
         # Refresh session view
@@ -432,8 +541,7 @@ class CraftingCog(commands.GroupCog, name="craft"):
 
         # Parse instance ID
         try:
-            instance_id = instance_id.strip().lstrip("#")
-            instance_pk = int(instance_id, 16)
+            instance_pk = int(instance_id.strip().lstrip("#"), 16)
         except ValueError:
             await interaction.followup.send("Invalid instance ID format. Use format like #ABC123", ephemeral=True)
             return
@@ -498,20 +606,16 @@ class CraftingCog(commands.GroupCog, name="craft"):
             await interaction.followup.send("Crafting is currently disabled.", ephemeral=True)
             return
 
-        recipes = await sync_to_async(list)(
-            CraftingRecipe.objects.filter(enabled=True)
-            .select_related("result_ball", "result_special")
-            .prefetch_related("ingredients__ball")
-        )
+        # LIMIT in SQL so only the shown recipes and their ingredients are loaded
+        recipes = await sync_to_async(list)(CraftingRecipe.for_cards()[:10])
 
         if not recipes:
             await interaction.followup.send("No crafting recipes are available right now.", ephemeral=True)
             return
 
         embeds = []
-        for recipe in recipes[:10]:
-            ingredients = await sync_to_async(list)(recipe.ingredients.select_related("ball").all())
-            ingredients_text = "\n".join(f"{i.quantity} × {i.ball.country}" for i in ingredients) or "None"
+        for recipe in recipes:
+            ingredients_text = "\n".join(f"{i.quantity} × {i.ball.country}" for i in recipe.display_ingredients) or "None"
 
             embed = discord.Embed(
                 title=recipe.name,
@@ -520,9 +624,9 @@ class CraftingCog(commands.GroupCog, name="craft"):
 
             embed.add_field(name="Ingredients", value=ingredients_text, inline=False)
 
-            if recipe.result_ball:
-                special = f" with {recipe.result_special.name}" if recipe.result_special else ""
-                result = f"{recipe.result_quantity} × {recipe.result_ball.country}{special}"
+            if recipe.result_ball_name:
+                special = f" with {recipe.result_special_name}" if recipe.result_special_name else ""
+                result = f"{recipe.result_quantity} × {recipe.result_ball_name}{special}"
                 embed.add_field(name="Result", value=result, inline=False)
 
             embeds.append(embed)